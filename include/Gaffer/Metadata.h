@@ -147,10 +147,21 @@ class Metadata
 		/// of the register*() methods. If dynamic metadata is registered
 		/// with a NodeValueFunction or PlugValueFunction then it is the
 		/// responsibility of the registrant to manually emit the signals
-		/// when necessary.
+		/// when necessary. Plug signals should be emitted using
+		/// emitPlugValueChanged() rather than directly, so that the
+		/// per-node signals are emitted as well as the global one.
 		static ValueChangedSignal &valueChangedSignal();
 		static NodeValueChangedSignal &nodeValueChangedSignal();
 		static PlugValueChangedSignal &plugValueChangedSignal();
+		/// Returns a signal emitted only for changes affecting the plugs of the
+		/// specified node. This should be preferred to the global signal when
+		/// only a single node is of interest, since it avoids every slot being
+		/// called for every change to every node.
+		static PlugValueChangedSignal &plugValueChangedSignal( Node *node );
+		/// Emits plugValueChangedSignal() and the per-node signals for all
+		/// nodes affected by the change. The plug argument should be NULL
+		/// when generic (rather than per-instance) metadata has changed.
+		static void emitPlugValueChanged( IECore::TypeId nodeTypeId, const StringAlgo::MatchPattern &plugPath, IECore::InternedString key, Gaffer::Plug *plug );
 
 		/// Deprecated
 		/// ==============
@@ -40,6 +40,8 @@
 #include <string>
 #include <vector>
 
+#include "boost/signals.hpp"
+
 #include "OpenEXR/ImathBox.h"
 
 namespace GafferImage
@@ -111,6 +113,13 @@ class Format
 		/// the empty string if the format has not been registered.
 		/// Note that this is unrelated to the ostream operator.
 		static std::string name( const Format &format );
+
+		typedef boost::signal<void ( const std::string & )> UnarySignal;
+		/// Emitted when a format is registered, or when an existing
+		/// registration is replaced with a new value.
+		static UnarySignal &formatAddedSignal();
+		/// Emitted when a format is deregistered.
+		static UnarySignal &formatRemovedSignal();
 		//@}
 
 	private :
@@ -46,54 +46,64 @@ import GafferCortexTest
 
 class OpHolderTest( GafferTest.TestCase ) :
 
+	@classmethod
+	def setUpClass( cls ) :
+
+		GafferTest.TestCase.setUpClass()
+
+		# Resolving the class specification requires a search of
+		# the IECORE_OP_PATHS, so we do it once for all the tests.
+		cls.__opSpec = GafferCortexTest.ParameterisedHolderTest.classSpecification( "primitive/renameVariables", "IECORE_OP_PATHS" )[:-1]
+
+		# Test input for the op. This is never modified, since the
+		# op copies its input before renaming anything.
+		cls.__plane = IECore.MeshPrimitive.createPlane( IECore.Box2f( IECore.V2f( -1 ), IECore.V2f( 1 ) ) )
+
 	def testType( self ) :
 
 		n = GafferCortex.OpHolder()
 		self.assertEqual( n.typeName(), "GafferCortex::OpHolder" )
-		self.failUnless( n.isInstanceOf( GafferCortex.ParameterisedHolderComputeNode.staticTypeId() ) )
-		self.failUnless( n.isInstanceOf( Gaffer.ComputeNode.staticTypeId() ) )
-		self.failUnless( n.isInstanceOf( Gaffer.DependencyNode.staticTypeId() ) )
+		self.assertTrue( n.isInstanceOf( GafferCortex.ParameterisedHolderComputeNode.staticTypeId() ) )
+		self.assertTrue( n.isInstanceOf( Gaffer.ComputeNode.staticTypeId() ) )
+		self.assertTrue( n.isInstanceOf( Gaffer.DependencyNode.staticTypeId() ) )
 
 	def testCompute( self ) :
 
-		m = IECore.MeshPrimitive.createPlane( IECore.Box2f( IECore.V2f( -1 ), IECore.V2f( 1 ) ) )
-		self.failUnless( "P" in m )
-		self.failUnless( "renamed" not in m )
+		m = self.__plane
+		self.assertTrue( "P" in m )
+		self.assertTrue( "renamed" not in m )
 
 		n = GafferCortex.OpHolder()
-		opSpec = GafferCortexTest.ParameterisedHolderTest.classSpecification( "primitive/renameVariables", "IECORE_OP_PATHS" )[:-1]
-		n.setOp( *opSpec )
+		n.setOp( *self.__opSpec )
 
 		n["parameters"]["input"].setValue( m )
 		n["parameters"]["names"].setValue( IECore.StringVectorData( [ "P renamed" ] ) )
 
 		m2 = n["result"].getValue()
 
-		self.failUnless( "P" not in m2 )
-		self.failUnless( "renamed" in m2 )
+		self.assertTrue( "P" not in m2 )
+		self.assertTrue( "renamed" in m2 )
 
 		n["parameters"]["names"].setValue( IECore.StringVectorData( [ "P renamedAgain" ] ) )
 
-		self.failUnless( "P" not in m2 )
-		self.failUnless( "renamed" in m2 )
+		self.assertTrue( "P" not in m2 )
+		self.assertTrue( "renamed" in m2 )
 
 	def testAffects( self ) :
 
 		n = GafferCortex.OpHolder()
-		opSpec = GafferCortexTest.ParameterisedHolderTest.classSpecification( "primitive/renameVariables", "IECORE_OP_PATHS" )[:-1]
-		n.setOp( *opSpec )
+		n.setOp( *self.__opSpec )
 
 		a = n.affects( n["parameters"]["input"] )
 		self.assertEqual( len( a ), 1 )
-		self.failUnless( a[0].isSame( n["result"] ) )
+		self.assertTrue( a[0].isSame( n["result"] ) )
 
 	def testSerialise( self ) :
 
 		s = Gaffer.ScriptNode()
 
 		s["op"] = GafferCortex.OpHolder()
-		opSpec = GafferCortexTest.ParameterisedHolderTest.classSpecification( "primitive/renameVariables", "IECORE_OP_PATHS" )[:-1]
-		s["op"].setOp( *opSpec )
+		s["op"].setOp( *self.__opSpec )
 
 		ss = s.serialise()
 
@@ -130,10 +140,11 @@ class OpHolderTest( GafferTest.TestCase ) :
 	def testRunTimeTyped( self ) :
 
 		n = GafferCortex.OpHolder()
+		typeId = n.typeId()
 
 		self.assertEqual( n.typeName(), "GafferCortex::OpHolder" )
-		self.assertEqual( IECore.RunTimeTyped.typeNameFromTypeId( n.typeId() ), "GafferCortex::OpHolder" )
-		self.assertEqual( IECore.RunTimeTyped.baseTypeId( n.typeId() ), GafferCortex.ParameterisedHolderComputeNode.staticTypeId() )
+		self.assertEqual( IECore.RunTimeTyped.typeNameFromTypeId( typeId ), "GafferCortex::OpHolder" )
+		self.assertEqual( IECore.RunTimeTyped.baseTypeId( typeId ), GafferCortex.ParameterisedHolderComputeNode.staticTypeId() )
 
 if __name__ == "__main__":
 	unittest.main()
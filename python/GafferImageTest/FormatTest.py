@@ -201,6 +201,24 @@ class FormatTest( GafferImageTest.ImageTestCase ) :
 		self.assertTrue( "testFormat" not in GafferImage.Format.registeredFormats() )
 		self.assertEqual( GafferImage.Format.name( f ), "" )
 
+	def testRegistrySignals( self ) :
+
+		added = GafferTest.CapturingSlot( GafferImage.Format.formatAddedSignal() )
+		removed = GafferTest.CapturingSlot( GafferImage.Format.formatRemovedSignal() )
+
+		GafferImage.Format.registerFormat( "testFormat", GafferImage.Format( 100, 200, 2 ) )
+		self.assertEqual( added, [ ( "testFormat", ) ] )
+		self.assertEqual( removed, [] )
+
+		GafferImage.Format.deregisterFormat( "testFormat" )
+		self.assertEqual( added, [ ( "testFormat", ) ] )
+		self.assertEqual( removed, [ ( "testFormat", ) ] )
+
+		# Deregistering a non-existent format shouldn't
+		# signal anything.
+		GafferImage.Format.deregisterFormat( "testFormat" )
+		self.assertEqual( removed, [ ( "testFormat", ) ] )
+
 	def testStr( self ) :
 
 		f = GafferImage.Format( 10, 20 )
@@ -51,23 +51,11 @@ class FormatPlugValueWidget( GafferUI.PlugValueWidget ) :
 		self.__menuButton = GafferUI.MenuButton( menu = GafferUI.Menu( Gaffer.WeakMethod( self.__menuDefinition ) ) )
 		grid[0:2,0] = self.__menuButton
 
-		self.__minLabel = GafferUI.Label( "Min" )
-		grid.addChild( self.__minLabel, index = ( 0, 1 ), alignment = ( GafferUI.HorizontalAlignment.Right, GafferUI.VerticalAlignment.Center ) )
-
-		self.__minWidget = GafferUI.CompoundNumericPlugValueWidget( plug["displayWindow"]["min"] )
-		grid[1,1] = self.__minWidget
-
-		self.__maxLabel = GafferUI.Label( "Max" )
-		grid.addChild( self.__maxLabel, index = ( 0, 2 ), alignment = ( GafferUI.HorizontalAlignment.Right, GafferUI.VerticalAlignment.Center ) )
-
-		self.__maxWidget = GafferUI.CompoundNumericPlugValueWidget( plug["displayWindow"]["max"] )
-		grid[1,2] = self.__maxWidget
-
-		self.__pixelAspectLabel = GafferUI.Label( "Pixel Aspect" )
-		grid.addChild( self.__pixelAspectLabel, index = ( 0, 3 ), alignment = ( GafferUI.HorizontalAlignment.Right, GafferUI.VerticalAlignment.Center ) )
-
-		self.__pixelAspectWidget = GafferUI.NumericPlugValueWidget( plug["pixelAspect"] )
-		grid[1,3] = self.__pixelAspectWidget
+		self.__grid = grid
+		# The widgets for editing custom formats are built lazily
+		# by __ensureCustomWidgets(), since most of the time they
+		# are not needed.
+		self.__customContainer = None
 
 		# If the plug hasn't got an input, the PlugValueWidget base class assumes we're not
 		# sensitive to contex changes and omits calls to _updateFromPlug(). But the default
@@ -75,23 +63,62 @@ class FormatPlugValueWidget( GafferUI.PlugValueWidget ) :
 		# necessary.
 		self.__contextChangedConnection = self.getContext().changedSignal().connect( Gaffer.WeakMethod( self.__contextChanged ) )
 
+		# The state last applied by _updateFromPlug(), so that we can
+		# avoid updating the widgets when nothing has changed.
+		self.__lastEditable = None
+		self.__lastMode = None
+		self.__lastFmt = None
+		self.__lastText = None
+
+		# Shared by all the menu items, so they don't each need to make their own.
+		self.__applyFormatWeakMethod = Gaffer.WeakMethod( self.__applyFormat )
+
 		self._addPopupMenu( self.__menuButton )
 		self._updateFromPlug()
 
 	def setPlug( self, plug ) :
 
-		self.__minWidget.setPlug( plug["displayWindow"]["min"] )
-		self.__maxWidget.setPlug( plug["displayWindow"]["max"] )
-		self.__pixelAspectWidget.setPlug( plug["pixelAspect"] )
+		if self.__customContainer is not None :
+			self.__minWidget.setPlug( plug["displayWindow"]["min"] )
+			self.__maxWidget.setPlug( plug["displayWindow"]["max"] )
+			self.__pixelAspectWidget.setPlug( plug["pixelAspect"] )
 
+		self.__lastFmt = None
 		GafferUI.PlugValueWidget.setPlug( self, plug )
 
+	## The widgets for the child plugs are only built when needed, so
+	# passing lazy = True will return None if they don't exist yet.
+	def childPlugValueWidget( self, childPlug, lazy=True ) :
+
+		if self.__customContainer is None :
+			if lazy :
+				return None
+			self.__ensureCustomWidgets()
+
+		for widget in ( self.__minWidget, self.__maxWidget, self.__pixelAspectWidget ) :
+			if widget.getPlug().isSame( childPlug ) :
+				return widget
+			result = widget.childPlugValueWidget( childPlug, lazy )
+			if result is not None :
+				return result
+
+		return None
+
 	def _updateFromPlug( self ) :
 
-		self.__menuButton.setEnabled( self._editable() )
+		self.__update()
+
+	# Updating requires the plug value to be computed, which is wasted
+	# effort if we're hidden (in a collapsed section for instance). So
+	# we defer the work until we're visible.
+	@GafferUI.LazyMethod( deferUntilIdle = False )
+	def __update( self ) :
+
+		editable = self._editable()
 
 		text = ""
 		mode = "standard"
+		fmt = GafferImage.Format()
 		if self.getPlug() is not None :
 
 			mode = Gaffer.Metadata.value( self.getPlug(), "formatPlugValueWidget:mode" )
@@ -104,40 +131,114 @@ class FormatPlugValueWidget( GafferUI.PlugValueWidget ) :
 				# The empty display window of the default format is
 				# confusing to look at, so turn off custom mode.
 				mode = "standard"
-			elif not GafferImage.Format.name( fmt ) :
+			elif not _formatName( fmt ) :
 				# If the chosen format hasn't been registered,
 				# force custom mode even if it hasn't been
 				# asked for explicitly.
 				mode = "custom"
 
+		if (
+			editable == self.__lastEditable and
+			mode == self.__lastMode and
+			text == self.__lastText and
+			self.__lastFmt is not None and fmt == self.__lastFmt
+		) :
+			return
+
+		self.__lastEditable = editable
+		self.__lastMode = mode
+		self.__lastFmt = fmt
+		self.__lastText = text
+
+		self.__menuButton.setEnabled( editable )
 		self.__menuButton.setText( text if mode != "custom" else "Custom" )
 
-		nonZeroOrigin = fmt.getDisplayWindow().min != IECore.V2i( 0 )
+		if mode == "custom" :
+			self.__ensureCustomWidgets()
+
+		self.__updateCustomWidgets()
+
+	# Updates the custom widgets, if they have been built, to match
+	# the state recorded by the last update.
+	def __updateCustomWidgets( self ) :
+
+		if self.__customContainer is None :
+			return
+
+		if self.__lastFmt is None :
+			# No update has been performed yet.
+			self.__customContainer.setVisible( False )
+			return
+
+		nonZeroOrigin = self.__lastFmt.getDisplayWindow().min != IECore.V2i( 0 )
 		for widget in ( self.__minLabel, self.__minWidget ) :
-			widget.setVisible( mode == "custom" and nonZeroOrigin )
+			widget.setVisible( nonZeroOrigin )
 
-		for widget in ( self.__maxLabel, self.__maxWidget, self.__pixelAspectLabel, self.__pixelAspectWidget ) :
-			widget.setVisible( mode == "custom" )
+		self.__customContainer.setVisible( self.__lastMode == "custom" )
 
 		self.__maxLabel.setText( "Max" if nonZeroOrigin else "Size" )
 
+	def __ensureCustomWidgets( self ) :
+
+		if self.__customContainer is not None :
+			return
+
+		plug = self.getPlug()
+
+		self.__customContainer = GafferUI.GridContainer( spacing = 4 )
+		self.__grid[0:2,1] = self.__customContainer
+
+		self.__minLabel = GafferUI.Label( "Min" )
+		self.__customContainer.addChild( self.__minLabel, index = ( 0, 0 ), alignment = ( GafferUI.HorizontalAlignment.Right, GafferUI.VerticalAlignment.Center ) )
+
+		self.__minWidget = GafferUI.CompoundNumericPlugValueWidget( plug["displayWindow"]["min"] )
+		self.__customContainer[1,0] = self.__minWidget
+
+		self.__maxLabel = GafferUI.Label( "Max" )
+		self.__customContainer.addChild( self.__maxLabel, index = ( 0, 1 ), alignment = ( GafferUI.HorizontalAlignment.Right, GafferUI.VerticalAlignment.Center ) )
+
+		self.__maxWidget = GafferUI.CompoundNumericPlugValueWidget( plug["displayWindow"]["max"] )
+		self.__customContainer[1,1] = self.__maxWidget
+
+		self.__pixelAspectLabel = GafferUI.Label( "Pixel Aspect" )
+		self.__customContainer.addChild( self.__pixelAspectLabel, index = ( 0, 2 ), alignment = ( GafferUI.HorizontalAlignment.Right, GafferUI.VerticalAlignment.Center ) )
+
+		self.__pixelAspectWidget = GafferUI.NumericPlugValueWidget( plug["pixelAspect"] )
+		self.__customContainer[1,2] = self.__pixelAspectWidget
+
+		self.__updateCustomWidgets()
+
 	def __menuDefinition( self ) :
 
 		result = IECore.MenuDefinition()
 		if self.getPlug() is None :
 			return result
 
-		formats = [ GafferImage.Format.format( n ) for n in GafferImage.Format.registeredFormats() ]
-		if not self.getPlug().ancestor( Gaffer.ScriptNode ).isSame( self.getPlug().node() ) :
-			formats.insert( 0, GafferImage.Format() )
-
+		registeredFormats = _registeredFormats()
 		currentFormat = self.getPlug().getValue()
 		modeIsCustom = Gaffer.Metadata.value( self.getPlug(), "formatPlugValueWidget:mode" ) == "custom"
-		for fmt in formats :
+		currentIsRegistered = _formatKey( currentFormat ) in registeredFormats["names"]
+
+		scriptNode = self.getPlug().ancestor( Gaffer.ScriptNode )
+		if scriptNode is None or not scriptNode.isSame( self.getPlug().node() ) :
+			defaultFormat = GafferImage.Format()
+			currentIsRegistered = currentIsRegistered or currentFormat == defaultFormat
 			result.append(
-				"/" + self.__formatLabel( fmt ),
+				"/" + self.__formatLabel( defaultFormat ),
 				{
-					"command" : functools.partial( Gaffer.WeakMethod( self.__applyFormat ), fmt = fmt ),
+					"command" : functools.partial( self.__applyFormatWeakMethod, fmt = defaultFormat ),
+					"checkBox" : defaultFormat == currentFormat and not modeIsCustom,
+				}
+			)
+
+		# We already know the names of the registered formats, so we
+		# build the labels directly rather than using __formatLabel(),
+		# which would need to search the registry for each name.
+		for name, fmt in registeredFormats["pairs"] :
+			result.append(
+				"/%s ( %s )" % ( name, str( fmt ) ),
+				{
+					"command" : functools.partial( self.__applyFormatWeakMethod, fmt = fmt ),
 					"checkBox" : fmt == currentFormat and not modeIsCustom,
 				}
 			)
@@ -148,7 +249,7 @@ class FormatPlugValueWidget( GafferUI.PlugValueWidget ) :
 			"/Custom",
 			{
 				"command" : Gaffer.WeakMethod( self.__applyCustomFormat ),
-				"checkBox" : modeIsCustom or currentFormat not in formats,
+				"checkBox" : modeIsCustom or not currentIsRegistered,
 			}
 		)
 
@@ -159,7 +260,7 @@ class FormatPlugValueWidget( GafferUI.PlugValueWidget ) :
 		if fmt == GafferImage.Format() :
 			return "Default ( %s )" % GafferImage.FormatPlug.getDefaultFormat( self.getContext() )
 		else :
-			name = GafferImage.Format.name( fmt )
+			name = _formatName( fmt )
 			if name :
 				return "%s ( %s )" % ( name, str( fmt ) )
 			else :
@@ -175,13 +276,20 @@ class FormatPlugValueWidget( GafferUI.PlugValueWidget ) :
 
 		with Gaffer.UndoContext( self.getPlug().ancestor( Gaffer.ScriptNode ) ) :
 
-			with self.getContext() :
-				if self.getPlug().getValue() == GafferImage.Format() :
-					# Format is empty. It's kindof confusing to display that
-					# to the user in the custom fields, so take the default
-					# format and set it explicitly as a starting point for
-					# editing.
-					self.getPlug().setValue( GafferImage.FormatPlug.getDefaultFormat( self.getContext() ) )
+			# We're only called from the menu, so we'll have been visible and
+			# therefore up to date, and can use the value from our last update
+			# rather than computing it again.
+			fmt = self.__lastFmt
+			if fmt is None :
+				with self.getContext() :
+					fmt = self.getPlug().getValue()
+
+			if fmt == GafferImage.Format() :
+				# Format is empty. It's kindof confusing to display that
+				# to the user in the custom fields, so take the default
+				# format and set it explicitly as a starting point for
+				# editing.
+				self.getPlug().setValue( GafferImage.FormatPlug.getDefaultFormat( self.getContext() ) )
 
 			# When we first switch to custom mode, the current value will
 			# actually be one of the registered formats. So we use this
@@ -196,4 +304,62 @@ class FormatPlugValueWidget( GafferUI.PlugValueWidget ) :
 		if key == "image:defaultFormat" :
 			self._updateFromPlug()
 
+##########################################################################
+# Registered format cache. This saves us querying the registry every time
+# a menu is shown. The formats are loaded from the registry once, and then
+# kept up to date incrementally as individual formats are added or removed.
+##########################################################################
+
+_formatsCache = { "formats" : None, "pairs" : None, "names" : None }
+
+## Returns a hashable key for a format. GafferImage.Format is not itself
+# hashable, so this is needed for fast lookups.
+def _formatKey( fmt ) :
+
+	displayWindow = fmt.getDisplayWindow()
+	return (
+		displayWindow.min.x, displayWindow.min.y,
+		displayWindow.max.x, displayWindow.max.y,
+		fmt.getPixelAspect(),
+	)
+
+def _registeredFormats() :
+
+	if _formatsCache["formats"] is None :
+		_formatsCache["formats"] = { n : GafferImage.Format.format( n ) for n in GafferImage.Format.registeredFormats() }
+
+	if _formatsCache["pairs"] is None :
+		pairs = sorted( _formatsCache["formats"].items(), key = lambda f : f[0] )
+		_formatsCache["pairs"] = pairs
+		# Mapping from format key to name. Where a format is registered
+		# under several names we want the first, to match Format.name().
+		_formatsCache["names"] = dict( ( _formatKey( f[1] ), f[0] ) for f in reversed( pairs ) )
+
+	return _formatsCache
+
+## Equivalent to GafferImage.Format.name(), but using the cache rather
+# than searching the registry.
+def _formatName( fmt ) :
+
+	return _registeredFormats()["names"].get( _formatKey( fmt ), "" )
+
+def __formatAdded( name ) :
+
+	if _formatsCache["formats"] is not None :
+		_formatsCache["formats"][name] = GafferImage.Format.format( name )
+
+	_formatsCache["pairs"] = None
+	_formatsCache["names"] = None
+
+def __formatRemoved( name ) :
+
+	if _formatsCache["formats"] is not None :
+		_formatsCache["formats"].pop( name, None )
+
+	_formatsCache["pairs"] = None
+	_formatsCache["names"] = None
+
+__formatAddedConnection = GafferImage.Format.formatAddedSignal().connect( __formatAdded )
+__formatRemovedConnection = GafferImage.Format.formatRemovedSignal().connect( __formatRemoved )
+
 GafferUI.PlugValueWidget.registerType( GafferImage.FormatPlug, FormatPlugValueWidget )
@@ -34,8 +34,11 @@
 #
 ##########################################################################
 
+import sys
 import unittest
 
+import IECore
+
 import Gaffer
 import GafferUI
 import GafferUITest
@@ -44,6 +47,19 @@ import GafferImageUI
 
 class FormatPlugValueWidgetTest( GafferUITest.TestCase ) :
 
+	def setUp( self ) :
+
+		GafferUITest.TestCase.setUp( self )
+
+		GafferImage.Format.registerFormat( "fpvwTest", GafferImage.Format( 100, 200 ) )
+
+	def tearDown( self ) :
+
+		for name in ( "fpvwTest", "fpvwTestB", "fpvwTestC", "fpvwTestD" ) :
+			GafferImage.Format.deregisterFormat( name )
+
+		GafferUITest.TestCase.tearDown( self )
+
 	def testCreation( self ):
 
 		s = Gaffer.ScriptNode()
@@ -54,5 +70,268 @@ class FormatPlugValueWidgetTest( GafferUITest.TestCase ) :
 		self.assertTrue( isinstance( w, GafferUI.PlugValueWidget ) )
 		self.assertTrue( w.getPlug().isSame( s["n"]["format"] ) )
 
+	def testStandardModeBuildsNoCustomWidgets( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["n"] = GafferImage.Constant()
+		s["n"]["format"].setValue( GafferImage.Format( 100, 200 ) )
+
+		with GafferUI.Window() as window :
+			w = GafferUI.PlugValueWidget.create( s["n"]["format"] )
+
+		window.setVisible( True )
+
+		for p in ( s["n"]["format"]["displayWindow"]["min"], s["n"]["format"]["displayWindow"]["max"], s["n"]["format"]["pixelAspect"] ) :
+			self.assertTrue( w.childPlugValueWidget( p ) is None )
+
+	def testCustomModeBuildsCustomWidgets( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["n"] = GafferImage.Constant()
+		s["n"]["format"].setValue( GafferImage.Format( 100, 200 ) )
+
+		with GafferUI.Window() as window :
+			w = GafferUI.PlugValueWidget.create( s["n"]["format"] )
+
+		window.setVisible( True )
+		self.assertTrue( w.childPlugValueWidget( s["n"]["format"]["displayWindow"]["max"] ) is None )
+
+		# Asking for custom mode via metadata should build
+		# and show the custom widgets.
+
+		Gaffer.Metadata.registerValue( s["n"]["format"], "formatPlugValueWidget:mode", "custom", persistent = False )
+
+		maxWidget = w.childPlugValueWidget( s["n"]["format"]["displayWindow"]["max"] )
+		self.assertTrue( isinstance( maxWidget, GafferUI.PlugValueWidget ) )
+		self.assertTrue( maxWidget.getPlug().isSame( s["n"]["format"]["displayWindow"]["max"] ) )
+		self.assertTrue( maxWidget.visible() )
+
+		# And going back to standard mode should hide them again.
+
+		Gaffer.Metadata.registerValue( s["n"]["format"], "formatPlugValueWidget:mode", "standard", persistent = False )
+		self.assertFalse( maxWidget.visible() )
+
+		# Unregistered formats force custom mode, regardless
+		# of the metadata.
+
+		s["n"]["format"].setValue( GafferImage.Format( 123, 456 ) )
+		self.assertTrue( maxWidget.visible() )
+
+	def testUnregisteredFormatBuildsCustomWidgets( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["n"] = GafferImage.Constant()
+		s["n"]["format"].setValue( GafferImage.Format( 123, 456 ) )
+
+		with GafferUI.Window() as window :
+			w = GafferUI.PlugValueWidget.create( s["n"]["format"] )
+
+		window.setVisible( True )
+
+		for p in ( s["n"]["format"]["displayWindow"]["max"], s["n"]["format"]["pixelAspect"] ) :
+			widget = w.childPlugValueWidget( p )
+			self.assertTrue( widget is not None )
+			self.assertTrue( widget.visible() )
+
+		# The min widget is only needed when the display
+		# window has a non-zero origin.
+
+		minWidget = w.childPlugValueWidget( s["n"]["format"]["displayWindow"]["min"] )
+		self.assertFalse( minWidget.visible() )
+
+		s["n"]["format"].setValue( GafferImage.Format( IECore.Box2i( IECore.V2i( 10 ), IECore.V2i( 123, 456 ) ) ) )
+		self.assertTrue( minWidget.visible() )
+
+	def testSetPlugRetargetsCustomWidgets( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["n1"] = GafferImage.Constant()
+		s["n1"]["format"].setValue( GafferImage.Format( 123, 456 ) )
+		s["n2"] = GafferImage.Constant()
+		s["n2"]["format"].setValue( GafferImage.Format( 789, 1011 ) )
+
+		with GafferUI.Window() as window :
+			w = GafferUI.PlugValueWidget.create( s["n1"]["format"] )
+
+		window.setVisible( True )
+		self.assertTrue( w.childPlugValueWidget( s["n1"]["format"]["displayWindow"]["max"] ) is not None )
+
+		w.setPlug( s["n2"]["format"] )
+
+		self.assertTrue( w.childPlugValueWidget( s["n1"]["format"]["displayWindow"]["max"] ) is None )
+		for p in ( s["n2"]["format"]["displayWindow"]["min"], s["n2"]["format"]["displayWindow"]["max"], s["n2"]["format"]["pixelAspect"] ) :
+			widget = w.childPlugValueWidget( p )
+			self.assertTrue( widget is not None )
+			self.assertTrue( widget.getPlug().isSame( p ) )
+
+	def testHiddenWidgetDefersUpdate( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["n"] = GafferImage.Constant()
+		s["n"]["format"].setValue( GafferImage.Format( 123, 456 ) )
+
+		with GafferUI.Window() as window :
+			w = GafferUI.PlugValueWidget.create( s["n"]["format"] )
+
+		# We're hidden, so the update that would build
+		# the custom widgets hasn't happened yet.
+		self.assertTrue( w.childPlugValueWidget( s["n"]["format"]["displayWindow"]["max"] ) is None )
+
+		# But it should happen as soon as we're shown.
+		window.setVisible( True )
+		maxWidget = w.childPlugValueWidget( s["n"]["format"]["displayWindow"]["max"] )
+		self.assertTrue( maxWidget is not None )
+		self.assertTrue( maxWidget.visible() )
+
+		# Changes made while hidden should be deferred too,
+		# and then caught up with when shown again.
+
+		window.setVisible( False )
+		s["n"]["format"].setValue( GafferImage.Format( 100, 200 ) )
+		self.assertTrue( maxWidget.visible( relativeTo = window ) )
+
+		window.setVisible( True )
+		self.assertFalse( maxWidget.visible() )
+
+	def testNodeAddedToScriptAfterConstruction( self ) :
+
+		n = GafferImage.Constant()
+		w = GafferUI.PlugValueWidget.create( n["format"] )
+
+		s = Gaffer.ScriptNode()
+		s["n"] = n
+
+		# The menu must find the ScriptNode, even though the node
+		# wasn't in it when the widget was built.
+		menuItems = dict( w._FormatPlugValueWidget__menuDefinition().items() )
+		self.assertTrue( "/fpvwTest ( 100x200 )" in menuItems )
+
+		# And applying a format should be undoable in that script.
+		self.assertFalse( s.undoAvailable() )
+		menuItems["/fpvwTest ( 100x200 )"].command( False )
+		self.assertEqual( n["format"].getValue(), GafferImage.Format( 100, 200 ) )
+		self.assertTrue( s.undoAvailable() )
+
+	def testBoxMovedToAnotherScript( self ) :
+
+		s1 = Gaffer.ScriptNode()
+		s1["b"] = Gaffer.Box()
+		s1["b"]["n"] = GafferImage.Constant()
+
+		w = GafferUI.PlugValueWidget.create( s1["b"]["n"]["format"] )
+
+		# Moving the box reparents an ancestor of the node, not the
+		# node itself, but the widget must still follow it to the
+		# new script.
+		s2 = Gaffer.ScriptNode()
+		s2["b"] = s1["b"]
+
+		menuItems = dict( w._FormatPlugValueWidget__menuDefinition().items() )
+		menuItems["/fpvwTest ( 100x200 )"].command( False )
+
+		self.assertEqual( s2["b"]["n"]["format"].getValue(), GafferImage.Format( 100, 200 ) )
+		self.assertTrue( s2.undoAvailable() )
+		self.assertFalse( s1.undoAvailable() )
+
+	def testCustomFromEmptyFormatUsesDefaultFormat( self ) :
+
+		s = Gaffer.ScriptNode()
+		s["n"] = GafferImage.Constant()
+		GafferImage.FormatPlug.acquireDefaultFormatPlug( s ).setValue( GafferImage.Format( 123, 456 ) )
+		self.assertEqual( s["n"]["format"].getValue(), GafferImage.Format() )
+
+		with GafferUI.Window() as window :
+			w = GafferUI.PlugValueWidget.create( s["n"]["format"] )
+
+		window.setVisible( True )
+
+		# Switching an empty format to custom mode should give
+		# the user the default format as a starting point.
+		menuItems = dict( w._FormatPlugValueWidget__menuDefinition().items() )
+		menuItems["/Custom"].command( False )
+
+		self.assertEqual( s["n"]["format"].getValue(), GafferImage.FormatPlug.getDefaultFormat( s.context() ) )
+		self.assertEqual( s["n"]["format"].getValue(), GafferImage.Format( 123, 456 ) )
+		self.assertEqual( Gaffer.Metadata.value( s["n"]["format"], "formatPlugValueWidget:mode" ), "custom" )
+
+		maxWidget = w.childPlugValueWidget( s["n"]["format"]["displayWindow"]["max"] )
+		self.assertTrue( maxWidget is not None )
+		self.assertTrue( maxWidget.visible() )
+
+		# And a single undo should take us back where we started.
+		s.undo()
+		self.assertEqual( s["n"]["format"].getValue(), GafferImage.Format() )
+		self.assertNotEqual( Gaffer.Metadata.value( s["n"]["format"], "formatPlugValueWidget:mode" ), "custom" )
+
+	def testFormatCacheTracksRegistry( self ) :
+
+		module = sys.modules[GafferImageUI.FormatPlugValueWidget.__module__]
+
+		s = Gaffer.ScriptNode()
+		s["n"] = GafferImage.Constant()
+		s["n"]["format"].setValue( GafferImage.Format( 300, 400 ) )
+
+		w = GafferUI.PlugValueWidget.create( s["n"]["format"] )
+
+		def menuItems() :
+
+			return dict( w._FormatPlugValueWidget__menuDefinition().items() )
+
+		# Make sure the cache is populated before we start
+		# changing the registry.
+
+		self.assertFalse( "/fpvwTestB ( 300x400 )" in menuItems() )
+		self.assertTrue( menuItems()["/Custom"].checkBox )
+		self.assertEqual( module._formatName( GafferImage.Format( 300, 400 ) ), "" )
+
+		# Registration
+
+		GafferImage.Format.registerFormat( "fpvwTestB", GafferImage.Format( 300, 400 ) )
+
+		self.assertEqual( module._formatName( GafferImage.Format( 300, 400 ) ), "fpvwTestB" )
+		items = menuItems()
+		self.assertTrue( items["/fpvwTestB ( 300x400 )"].checkBox )
+		self.assertFalse( items["/Custom"].checkBox )
+
+		# Reregistration with a new value
+
+		GafferImage.Format.registerFormat( "fpvwTestB", GafferImage.Format( 500, 600 ) )
+
+		self.assertEqual( module._formatName( GafferImage.Format( 300, 400 ) ), "" )
+		self.assertEqual( module._formatName( GafferImage.Format( 500, 600 ) ), "fpvwTestB" )
+		items = menuItems()
+		self.assertFalse( "/fpvwTestB ( 300x400 )" in items )
+		self.assertFalse( items["/fpvwTestB ( 500x600 )"].checkBox )
+		self.assertTrue( items["/Custom"].checkBox )
+
+		# Deregistration
+
+		GafferImage.Format.deregisterFormat( "fpvwTestB" )
+
+		self.assertEqual( module._formatName( GafferImage.Format( 500, 600 ) ), "" )
+		items = menuItems()
+		self.assertFalse( "/fpvwTestB ( 500x600 )" in items )
+		self.assertTrue( items["/Custom"].checkBox )
+
+	def testFormatNameWithMultipleRegistrations( self ) :
+
+		module = sys.modules[GafferImageUI.FormatPlugValueWidget.__module__]
+
+		f = GafferImage.Format( 700, 800 )
+		self.assertEqual( module._formatName( f ), "" )
+
+		# Register in reverse order, so we know the result
+		# doesn't just depend on the order of registration.
+		GafferImage.Format.registerFormat( "fpvwTestD", f )
+		GafferImage.Format.registerFormat( "fpvwTestC", f )
+
+		self.assertEqual( GafferImage.Format.name( f ), "fpvwTestC" )
+		self.assertEqual( module._formatName( f ), "fpvwTestC" )
+
+		GafferImage.Format.deregisterFormat( "fpvwTestC" )
+
+		self.assertEqual( GafferImage.Format.name( f ), "fpvwTestD" )
+		self.assertEqual( module._formatName( f ), "fpvwTestD" )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -35,6 +35,7 @@
 ##########################################################################
 
 import unittest
+import weakref
 
 import IECore
 
@@ -687,6 +688,97 @@ class MetadataTest( GafferTest.TestCase ) :
 		self.assertEqual( len( ncs ), 3 )
 		self.assertEqual( len( pcs ), 3 )
 
+	def testPlugValueChangedSignalForNode( self ) :
+
+		n1 = GafferTest.AddNode()
+		n2 = GafferTest.AddNode()
+
+		cs1 = GafferTest.CapturingSlot( Gaffer.Metadata.plugValueChangedSignal( n1 ) )
+		cs2 = GafferTest.CapturingSlot( Gaffer.Metadata.plugValueChangedSignal( n2 ) )
+
+		Gaffer.Metadata.registerValue( n1["op1"], "test", 1 )
+		self.assertEqual( len( cs1 ), 1 )
+		self.assertEqual( cs1[0], ( GafferTest.AddNode.staticTypeId(), "op1", "test", n1["op1"] ) )
+		self.assertEqual( len( cs2 ), 0 )
+
+		Gaffer.Metadata.registerValue( n2["op2"], "test", 2 )
+		self.assertEqual( len( cs1 ), 1 )
+		self.assertEqual( len( cs2 ), 1 )
+		self.assertEqual( cs2[0], ( GafferTest.AddNode.staticTypeId(), "op2", "test", n2["op2"] ) )
+
+		# Per-type registrations must be signalled to all
+		# nodes of that type.
+
+		Gaffer.Metadata.registerValue( GafferTest.AddNode, "op1", "test", 3 )
+		self.assertEqual( len( cs1 ), 2 )
+		self.assertEqual( len( cs2 ), 2 )
+		self.assertEqual( cs1[1], ( GafferTest.AddNode.staticTypeId(), "op1", "test", None ) )
+		self.assertEqual( cs2[1], ( GafferTest.AddNode.staticTypeId(), "op1", "test", None ) )
+
+		Gaffer.Metadata.deregisterValue( GafferTest.AddNode, "op1", "test" )
+		self.assertEqual( len( cs1 ), 3 )
+		self.assertEqual( len( cs2 ), 3 )
+
+		# But registrations for unrelated types must not.
+
+		Gaffer.Metadata.registerValue( GafferTest.SphereNode, "radius", "test", 4 )
+		self.assertEqual( len( cs1 ), 3 )
+		self.assertEqual( len( cs2 ), 3 )
+
+		Gaffer.Metadata.deregisterValue( GafferTest.SphereNode, "radius", "test" )
+
+		# Manual emission must reach the per-node signal as
+		# well as the global one.
+
+		gcs = GafferTest.CapturingSlot( Gaffer.Metadata.plugValueChangedSignal() )
+		Gaffer.Metadata.emitPlugValueChanged( GafferTest.AddNode.staticTypeId(), "op1", "test", n1["op1"] )
+		self.assertEqual( len( gcs ), 1 )
+		self.assertEqual( len( cs1 ), 4 )
+		self.assertEqual( cs1[3], ( GafferTest.AddNode.staticTypeId(), "op1", "test", n1["op1"] ) )
+		self.assertEqual( len( cs2 ), 3 )
+
+	def testPlugValueChangedSignalKeepsNodeAlive( self ) :
+
+		n = GafferTest.AddNode()
+		w = weakref.ref( n )
+
+		s = Gaffer.Metadata.plugValueChangedSignal( n )
+		del n
+		self.assertTrue( w() is not None )
+
+		del s
+		self.assertTrue( w() is None )
+
+	def testPlugValueChangedSignalForDeletedNode( self ) :
+
+		n = GafferTest.AddNode()
+		w = weakref.ref( n )
+		cs = GafferTest.CapturingSlot( Gaffer.Metadata.plugValueChangedSignal( n ) )
+
+		del n
+		self.assertTrue( w() is None )
+
+		# The deleted node's signal should have been removed,
+		# so per-type changes must neither crash nor reach the
+		# old slot.
+
+		Gaffer.Metadata.registerValue( GafferTest.AddNode, "op1", "test", 1 )
+		Gaffer.Metadata.deregisterValue( GafferTest.AddNode, "op1", "test" )
+		self.assertEqual( len( cs ), 0 )
+
+		# And a new node of the same type, even if allocated at
+		# the same address, must not inherit the old slot.
+
+		n2 = GafferTest.AddNode()
+		cs2 = GafferTest.CapturingSlot( Gaffer.Metadata.plugValueChangedSignal( n2 ) )
+
+		Gaffer.Metadata.registerValue( n2["op1"], "test", 2 )
+		Gaffer.Metadata.registerValue( GafferTest.AddNode, "op1", "test", 3 )
+		Gaffer.Metadata.deregisterValue( GafferTest.AddNode, "op1", "test" )
+
+		self.assertEqual( len( cs ), 0 )
+		self.assertEqual( len( cs2 ), 3 )
+
 	def testExactPreferredToWildcards( self ) :
 
 		class MetadataTestNodeD( Gaffer.Node ) :
@@ -43,6 +43,7 @@
 #include "boost/multi_index/ordered_index.hpp"
 #include "boost/multi_index/member.hpp"
 #include "boost/optional.hpp"
+#include "boost/shared_ptr.hpp"
 
 #include "IECore/CompoundData.h"
 #include "IECore/SimpleTypedData.h"
@@ -201,6 +202,15 @@ OptionalData instanceValue( const GraphComponent *instance, InternedString key,
 	return OptionalData();
 }
 
+typedef boost::shared_ptr<Metadata::PlugValueChangedSignal> PlugValueChangedSignalPtr;
+typedef std::map<const Node *, PlugValueChangedSignalPtr> NodePlugValueChangedSignals;
+
+NodePlugValueChangedSignals &nodePlugValueChangedSignals()
+{
+	static NodePlugValueChangedSignals s;
+	return s;
+}
+
 void registerInstanceValueAction( GraphComponent *instance, InternedString key, OptionalData value, bool persistent )
 {
 	InstanceValues *m = instanceMetadata( instance, /* createIfMissing = */ static_cast<bool>( value ) );
@@ -238,7 +248,7 @@ void registerInstanceValueAction( GraphComponent *instance, InternedString key,
 	{
 		if( const Node *node = plug->node() )
 		{
-			Metadata::plugValueChangedSignal()( node->typeId(), plug->relativeName( node ), key, plug );
+			Metadata::emitPlugValueChanged( node->typeId(), plug->relativeName( node ), key, plug );
 		}
 	}
 }
@@ -529,7 +539,7 @@ void Metadata::registerPlugValue( IECore::TypeId nodeTypeId, const StringAlgo::M
 		plugValues.replace( it, namedValue );
 	}
 
-	plugValueChangedSignal()( nodeTypeId, plugPath, key, NULL );
+	emitPlugValueChanged( nodeTypeId, plugPath, key, NULL );
 }
 
 void Metadata::registerPlugValue( Plug *plug, IECore::InternedString key, IECore::ConstDataPtr value, bool persistent )
@@ -639,7 +649,7 @@ void Metadata::deregisterPlugValue( IECore::TypeId nodeTypeId, const StringAlgo:
 	}
 
 	plugValues.erase( it );
-	plugValueChangedSignal()( nodeTypeId, plugPath, key, NULL );
+	emitPlugValueChanged( nodeTypeId, plugPath, key, NULL );
 }
 
 void Metadata::deregisterPlugValue( Plug *plug, IECore::InternedString key )
@@ -764,7 +774,55 @@ Metadata::PlugValueChangedSignal &Metadata::plugValueChangedSignal()
 	return s;
 }
 
+Metadata::PlugValueChangedSignal &Metadata::plugValueChangedSignal( Node *node )
+{
+	PlugValueChangedSignalPtr &s = nodePlugValueChangedSignals()[node];
+	if( !s )
+	{
+		s.reset( new PlugValueChangedSignal );
+	}
+	return *s;
+}
+
+void Metadata::emitPlugValueChanged( IECore::TypeId nodeTypeId, const StringAlgo::MatchPattern &plugPath, InternedString key, Plug *plug )
+{
+	plugValueChangedSignal()( nodeTypeId, plugPath, key, plug );
+
+	// We take copies of the signals to be emitted before emitting any of
+	// them, because slots are free to create or destroy nodes, which would
+	// invalidate our iterators.
+	std::vector<PlugValueChangedSignalPtr> signals;
+	const NodePlugValueChangedSignals &s = nodePlugValueChangedSignals();
+	if( plug )
+	{
+		NodePlugValueChangedSignals::const_iterator it = s.find( plug->node() );
+		if( it != s.end() )
+		{
+			signals.push_back( it->second );
+		}
+	}
+	else
+	{
+		for( NodePlugValueChangedSignals::const_iterator it = s.begin(), eIt = s.end(); it != eIt; ++it )
+		{
+			if( it->first->isInstanceOf( nodeTypeId ) )
+			{
+				signals.push_back( it->second );
+			}
+		}
+	}
+
+	for( std::vector<PlugValueChangedSignalPtr>::const_iterator it = signals.begin(), eIt = signals.end(); it != eIt; ++it )
+	{
+		(**it)( nodeTypeId, plugPath, key, plug );
+	}
+}
+
 void Metadata::clearInstanceMetadata( const GraphComponent *graphComponent )
 {
 	instanceMetadataMap().erase( graphComponent );
+	if( const Node *node = runTimeCast<const Node>( graphComponent ) )
+	{
+		nodePlugValueChangedSignals().erase( node );
+	}
 }
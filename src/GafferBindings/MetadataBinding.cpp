@@ -529,9 +529,13 @@ void bindMetadata()
 		.def( "nodeValueChangedSignal", &Metadata::nodeValueChangedSignal, return_value_policy<reference_existing_object>() )
 		.staticmethod( "nodeValueChangedSignal" )
 
-		.def( "plugValueChangedSignal", &Metadata::plugValueChangedSignal, return_value_policy<reference_existing_object>() )
+		.def( "plugValueChangedSignal", (Metadata::PlugValueChangedSignal &(*)())&Metadata::plugValueChangedSignal, return_value_policy<reference_existing_object>() )
+		.def( "plugValueChangedSignal", (Metadata::PlugValueChangedSignal &(*)( Node * ))&Metadata::plugValueChangedSignal, return_internal_reference<1>() )
 		.staticmethod( "plugValueChangedSignal" )
 
+		.def( "emitPlugValueChanged", &Metadata::emitPlugValueChanged )
+		.staticmethod( "emitPlugValueChanged" )
+
 		.def( "plugsWithMetadata", &plugsWithMetadata,
 			(
 				boost::python::arg( "root" ),
@@ -75,11 +75,15 @@ std::ostream &GafferImage::operator << ( std::ostream &os, GafferImage::Format c
 void Format::registerFormat( const std::string &name, const Format &format )
 {
 	formatMap()[name] = format;
+	formatAddedSignal()( name );
 }
 
 void Format::deregisterFormat( const std::string &name )
 {
-	formatMap().erase( name );
+	if( formatMap().erase( name ) )
+	{
+		formatRemovedSignal()( name );
+	}
 }
 
 void Format::registeredFormats( std::vector<std::string> &names )
@@ -118,3 +122,15 @@ std::string Format::name( const Format &format )
 	}
 	return "";
 }
+
+Format::UnarySignal &Format::formatAddedSignal()
+{
+	static UnarySignal s;
+	return s;
+}
+
+Format::UnarySignal &Format::formatRemovedSignal()
+{
+	static UnarySignal s;
+	return s;
+}
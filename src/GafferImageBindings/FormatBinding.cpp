@@ -36,6 +36,8 @@
 #include "boost/format.hpp"
 #include "boost/lexical_cast.hpp"
 
+#include "GafferBindings/SignalBinding.h"
+
 #include "GafferImageBindings/FormatBinding.h"
 
 using namespace boost::python;
@@ -84,11 +86,27 @@ std::string formatRepr( const GafferImage::Format &format )
 	}
 }
 
+struct UnarySlotCaller
+{
+	boost::signals::detail::unusable operator()( boost::python::object slot, const std::string &name )
+	{
+		try
+		{
+			slot( name );
+		}
+		catch( const error_already_set &e )
+		{
+			PyErr_PrintEx( 0 ); // clears the error status
+		}
+		return boost::signals::detail::unusable();
+	}
+};
+
 } // namespace
 
 void GafferImageBindings::bindFormat()
 {
-	class_<Format>( "Format" )
+	scope s = class_<Format>( "Format" )
 
 		.def(
 			init<int, int, double>(
@@ -133,6 +151,10 @@ void GafferImageBindings::bindFormat()
 		.def( "registeredFormats", &registeredFormats ).staticmethod( "registeredFormats" )
 		.def( "format", &Format::format ).staticmethod( "format" )
 		.def( "name", &Format::name ).staticmethod( "name" )
+		.def( "formatAddedSignal", &Format::formatAddedSignal, return_value_policy<reference_existing_object>() ).staticmethod( "formatAddedSignal" )
+		.def( "formatRemovedSignal", &Format::formatRemovedSignal, return_value_policy<reference_existing_object>() ).staticmethod( "formatRemovedSignal" )
 	;
 
+	GafferBindings::SignalClass<Format::UnarySignal, GafferBindings::DefaultSignalCaller<Format::UnarySignal>, UnarySlotCaller>( "UnarySignal" );
+
 }